@@ -3,6 +3,7 @@ from lmfit import models as lmm
 from lmfit import Model, Parameters
 from lmfit.model import ModelResult
 from functools import partial
+from scipy.signal import correlate
 
 # Fit functions
 
@@ -889,6 +890,16 @@ def RCSJfit(xdata,ydata,p0=None,inputinfo=None):
     except Exception as e:
         return e
 
+def _autocorrelation(x):
+    # Same as np.correlate(x,x,mode='full')[len(x)-1:], but scipy picks an FFT-based method for long
+    # arrays, making it O(N log N) instead of O(N^2).
+    return correlate(x,x,mode='full',method='auto')[len(x)-1:]
+
+def _autocorrelation_norm(x):
+    # The full autocorrelation peaks at zero lag, so normalise by that value.
+    autocorr=_autocorrelation(x)
+    return autocorr/autocorr[0]
+
 def statistics(xdata,ydata,p0,inputinfo):
     '''Return various statists from the data
     
@@ -925,8 +936,8 @@ def statistics(xdata,ydata,p0,inputinfo):
             'sum':np.sum,
             'skew':lambda x: np.mean((x-np.mean(x))**3)/np.std(x)**3,
             'percentile':lambda x: np.percentile(x,percentiles),
-            'autocorrelation': lambda x: np.correlate(x,x,mode='full')[len(x)-1:],
-            'autocorrelation_norm': lambda x: np.correlate(x,x,mode='full')[len(x)-1:]/np.max(np.correlate(x,x,mode='full'))
+            'autocorrelation': _autocorrelation,
+            'autocorrelation_norm': _autocorrelation_norm
         }
 
         result={}
@@ -943,6 +954,9 @@ def statistics(xdata,ydata,p0,inputinfo):
                 if function == 'percentile':
                     result[function]=function_dict[function](ydata)
                     result['percentiles']=percentiles
+                elif function == 'autocorrelation_norm' and 'autocorrelation' in result:
+                    # Reuse the autocorrelation if already calculated
+                    result[function]=result['autocorrelation']/result['autocorrelation'][0]
                 else:
                     result[function]=function_dict[function](ydata)
         result['xdata']=xdata
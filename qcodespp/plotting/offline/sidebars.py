@@ -3,6 +3,7 @@ from json import load as jsonload
 from json import dump as jsondump
 
 import copy
+from functools import lru_cache
 
 import qcodespp.plotting.offline.fits as fits
 
@@ -17,6 +18,36 @@ mplstyle.use('fast')
 
 from qcodespp.plotting.offline.helpers import cmaps, NoScrollQComboBox
 
+# Colormaps used for fit components; picked to contrast with the trace colormap.
+_PLASMA = cm.get_cmap('plasma')
+_VIRIDIS = cm.get_cmap('viridis')
+_COMPONENT_CMAPS = {'viridis': _PLASMA, 'plasma': _VIRIDIS}
+
+@lru_cache(maxsize=32)
+def _component_color_positions(n):
+    # Positions along the colormap for n fit components. Cached since the same
+    # number of components is drawn on every redraw.
+    return np.linspace(0.1,0.9,n)
+
+def _stats_value_for_json(value):
+    if isinstance(value,np.ndarray):
+        return value.tolist()
+    return value
+
+def _write_stats_json(export_dict,filename):
+    # Always the stdlib json, so the file is the same on every machine: NaN stays NaN
+    # (orjson would write null) and the indent is 4 (orjson only supports 2).
+    with open(filename, 'w', encoding='utf-8') as f:
+        jsondump(export_dict, f, ensure_ascii=False,indent=4)
+
+def _fit_line(function_class, function_name, x_forfit, y_forfit, p0, inputinfo):
+    # Exceptions are returned rather than raised, so a failed fit is reported like fits.fit_data does.
+    try:
+        return fits.fit_data(function_class=function_class, function_name=function_name,
+                             xdata=x_forfit,ydata=y_forfit, p0=p0, inputinfo=inputinfo)
+    except Exception as e:
+        return e
+
 class Sidebar1D(QtWidgets.QWidget):
     def __init__(self, parent, editor_window=None):
         super().__init__()
@@ -25,6 +56,7 @@ class Sidebar1D(QtWidgets.QWidget):
         self.setMaximumWidth(500)
         self.parent = parent
         self.running = True
+        self._row_of_line = {} # Maps line index -> row in trace_table
         self.init_widgets()
         self.init_connections()
         self.init_layouts()
@@ -246,6 +278,7 @@ class Sidebar1D(QtWidgets.QWidget):
         # It updates the trace table with the new data.
         self.trace_table.setRowCount(0)
         self.trace_table.clear()
+        self._row_of_line = {}
         if self.parent.plot_type == 'Histogram':
             self.trace_table.setHorizontalHeaderLabels(['#','Bins','Data','style','color', 'width',
                                                         'Xerr','Yerr','show fit','show fit cmpts','show fit err'])
@@ -278,6 +311,11 @@ class Sidebar1D(QtWidgets.QWidget):
         # ... and the filters.
         self.editor_window.show_current_filters()
 
+    def _reindex_rows(self):
+        # Rebuild the line -> row map after rows have been removed or reordered.
+        self._row_of_line = {int(self.trace_table.item(row,0).text()): row 
+                             for row in range(self.trace_table.rowCount())}
+
     def get_checked_items(self, return_indices = False, traces_or_fits='traces'):
         # Note this is a bit different to the main window, where the entire item is returned.
         # Here we just return the identifier for the linetrace
@@ -462,6 +500,7 @@ class Sidebar1D(QtWidgets.QWidget):
             plot_uncertainty_item.setCheckState(line['fit']['fit_uncertainty_checkstate'])
         
         self.trace_table.setItem(row,0,linetrace_item)
+        self._row_of_line[index] = row
         if self.parent.plot_type == 'Histogram':
             self.trace_table.setItem(row,1,bins_item)
         else:
@@ -524,11 +563,13 @@ class Sidebar1D(QtWidgets.QWidget):
                 linetrace = int(self.trace_table.item(row,0).text())
                 self.parent.plotted_lines.pop(linetrace)
                 self.trace_table.removeRow(row)
+                self._reindex_rows()
             except Exception as e:
                 self.editor_window.log_error(f'Cannot remove selected trace:\n{type(e).__name__}: {e}', show_popup=True)
         elif which=='all':
             self.parent.plotted_lines = {}
             self.trace_table.setRowCount(0)
+            self._row_of_line = {}
 
         self.editor_window.update_plots(update_data=False)
 
@@ -561,6 +602,7 @@ class Sidebar1D(QtWidgets.QWidget):
                             self.trace_table.setCellWidget(new_row, col, combo)
                 if current_col >= 0:
                     self.trace_table.setCurrentCell(new_row, current_col)
+                self._reindex_rows()
 
         except Exception as e:
             pass
@@ -579,7 +621,7 @@ class Sidebar1D(QtWidgets.QWidget):
             lines_to_color = self.get_checked_items(traces_or_fits='traces')
 
         line_colors = selected_colormap(np.linspace(0.1,0.9,len(lines_to_color)))
-        rows = [self.trace_table.row(self.trace_table.findItems(str(line), QtCore.Qt.MatchExactly)[0]) for line in lines_to_color]
+        rows = [self._row_of_line[line] for line in lines_to_color]
 
         for i,line in enumerate(lines_to_color):
             self.parent.plotted_lines[line]['linecolor'] = line_colors[i]
@@ -669,7 +711,7 @@ class Sidebar1D(QtWidgets.QWidget):
         item = self.trace_table.currentItem()
         item.setText(signal.text())
 
-    def limits_edited(self):
+    def limits_edited(self,draw=True):
         try:
             if hasattr(self, 'minline'):
                 self.minline.remove()
@@ -687,7 +729,8 @@ class Sidebar1D(QtWidgets.QWidget):
         if xmax != '':
             xmax=float(xmax)
             self.maxline=self.parent.axes.axvline(xmax, 0,0.1, color='red', linestyle='--')
-        self.parent.canvas.draw()
+        if draw:
+            self.parent.canvas.draw()
     
     def reset_limits(self):
         try:
@@ -706,15 +749,17 @@ class Sidebar1D(QtWidgets.QWidget):
   
     def update(self,clearplot=True):
         if self.running:
-            self.draw_plot(clearplot)
+            # Scan the table once per update cycle and share the result with draw_plot.
+            lines = self.get_checked_items(traces_or_fits='traces')
             fit_lines = self.get_checked_items(traces_or_fits='fits')
+            self.draw_plot(clearplot, lines=lines)
             if len(fit_lines) > 0:
                 for line in fit_lines:
                     if 'fit' in self.parent.plotted_lines[line].keys():
                         self.draw_fits(line)
                         
             if self.xmin_box.text() != '' or self.xmax_box.text() != '':
-                self.limits_edited()
+                self.limits_edited(draw=False)
         
         self.parent.canvas.draw()
     
@@ -805,30 +850,35 @@ class Sidebar1D(QtWidgets.QWidget):
             p0 = None
         return p0
 
-    def start_fitting(self,line='manual',multilinefit=False):
-        success=False
-        if line=='manual':
-            current_row = self.trace_table.currentRow()
-            line = int(self.trace_table.item(current_row,0).text())
-        else: # We are being passed the line from fit_checked
-            # Still need to find the 'current row' to put a checkbox there later
-            labels=[int(self.trace_table.item(row,0).text()) for row in range(self.trace_table.rowCount())]
-            current_row=labels.index(line)
+    def collect_fit_args(self,line):
+        # Gather everything needed to fit a line. Touches the parent data and Qt widgets, so must run on the GUI thread.
         x,y=self.get_line_data(line)
         x_forfit, y_forfit = self.collect_fit_data(x,y)
         function_class = self.fit_class_box.currentText()
         function_name = self.fit_box.currentText()
         inputinfo=self.collect_fit_inputs(function_class,function_name)
         p0=self.collect_init_guess(function_class,function_name)
+        return function_class, function_name, x_forfit, y_forfit, p0, inputinfo
+
+    def start_fitting(self,line='manual',multilinefit=False):
+        if line=='manual':
+            current_row = self.trace_table.currentRow()
+            line = int(self.trace_table.item(current_row,0).text())
+        else: # We are being passed the line from fit_checked
+            # Still need to find the 'current row' to put a checkbox there later
+            current_row = self._row_of_line[line]
+        fit_args = self.collect_fit_args(line)
+        fit_result = _fit_line(*fit_args)
+        return self.apply_fit_result(line,current_row,fit_args,fit_result,multilinefit)
 
-        # Try to do the fit.
+    def apply_fit_result(self,line,current_row,fit_args,fit_result,multilinefit=False):
+        # Store the result of _fit_line and update the table. Must run on the GUI thread.
+        success=False
+        function_class, function_name, x_forfit, y_forfit, p0, inputinfo = fit_args
         if function_name != 'Statistics':
             if 'stats' in self.parent.plotted_lines[line].keys():
                 self.parent.plotted_lines[line].pop('stats')
             try:
-                fit_result = fits.fit_data(function_class=function_class, function_name=function_name,
-                                                    xdata=x_forfit,ydata=y_forfit, p0=p0, inputinfo=inputinfo)
-
                 if isinstance(fit_result, Exception):
                     self.output_window.setText(f'Curve could not be fitted:\n{type(fit_result).__name__}: {fit_result}')
                     self.editor_window.log_error(f'Curve could not be fitted:\n{type(fit_result).__name__}: {fit_result}')
@@ -879,19 +929,23 @@ class Sidebar1D(QtWidgets.QWidget):
         else:
             if 'fit' in self.parent.plotted_lines[line].keys():
                 self.clear_fit(line)
-            self.parent.plotted_lines[line]['stats'] = fits.fit_data(function_class=function_class, 
-                                                                                           function_name=function_name,
-                                                    xdata=x_forfit,ydata=y_forfit, p0=p0, inputinfo=inputinfo)
-            if 'autocorrelation' in self.parent.plotted_lines[line]['stats'].keys():
-                self.parent.add_array_to_data_dict(self.parent.plotted_lines[line]['stats']['xdata'],'x_for_autocorr')
-                self.parent.add_array_to_data_dict(self.parent.plotted_lines[line]['stats']['autocorrelation'],'autocorrelation')
-            if 'autocorrelation_norm' in self.parent.plotted_lines[line]['stats'].keys():
-                self.parent.add_array_to_data_dict(self.parent.plotted_lines[line]['stats']['xdata'],'x_for_autocorr')
-                self.parent.add_array_to_data_dict(self.parent.plotted_lines[line]['stats']['autocorrelation_norm'],'autocorrelation_norm')
-            if 'percentile' in self.parent.plotted_lines[line]['stats'].keys():
-                self.parent.add_array_to_data_dict(self.parent.plotted_lines[line]['stats']['percentile'],'percentile')
-                self.parent.add_array_to_data_dict(self.parent.plotted_lines[line]['stats']['percentiles'],'percentiles')
-            success=True
+            if isinstance(fit_result, Exception):
+                self.output_window.setText(f'Could not calculate statistics:\n{type(fit_result).__name__}: {fit_result}')
+                self.editor_window.log_error(f'Could not calculate statistics:\n{type(fit_result).__name__}: {fit_result}')
+                if multilinefit:
+                    return fit_result
+            else:
+                self.parent.plotted_lines[line]['stats'] = fit_result
+                if 'autocorrelation' in self.parent.plotted_lines[line]['stats'].keys():
+                    self.parent.add_array_to_data_dict(self.parent.plotted_lines[line]['stats']['xdata'],'x_for_autocorr')
+                    self.parent.add_array_to_data_dict(self.parent.plotted_lines[line]['stats']['autocorrelation'],'autocorrelation')
+                if 'autocorrelation_norm' in self.parent.plotted_lines[line]['stats'].keys():
+                    self.parent.add_array_to_data_dict(self.parent.plotted_lines[line]['stats']['xdata'],'x_for_autocorr')
+                    self.parent.add_array_to_data_dict(self.parent.plotted_lines[line]['stats']['autocorrelation_norm'],'autocorrelation_norm')
+                if 'percentile' in self.parent.plotted_lines[line]['stats'].keys():
+                    self.parent.add_array_to_data_dict(self.parent.plotted_lines[line]['stats']['percentile'],'percentile')
+                    self.parent.add_array_to_data_dict(self.parent.plotted_lines[line]['stats']['percentiles'],'percentiles')
+                success=True
 
             #self.parent.prepare_data_for_plot(reload_data=True,reload_from_file=False,linefrompopup=line)
         
@@ -903,15 +957,19 @@ class Sidebar1D(QtWidgets.QWidget):
         # Fit all checked items in the table.
         fit_lines = self.get_checked_items(traces_or_fits='traces')
         minilog=[]
+        error=None
         for line in fit_lines:
-            error=self.start_fitting(line,multilinefit=True)
+            fit_args=self.collect_fit_args(line)
+            error=self.apply_fit_result(line,self._row_of_line[line],fit_args,
+                                        _fit_line(*fit_args),multilinefit=True)
             if error:
-                minilog.append(f'Trace {line} could not be fitted: {error}')
+                minilog.append((line,error))
         if len(minilog)>0:
-            error_message = 'The following errors occurred while fitting:\n\n' + '\n\n'.join(minilog)
+            error_message = ('The following errors occurred while fitting:\n\n' + 
+                             '\n\n'.join(f'Trace {l} could not be fitted: {e}' for l,e in minilog))
             self.ew = ErrorWindow(error_message)
-        if not error:
-            self.print_parameters(line)
+        if fit_lines and not error:
+            self.print_parameters(fit_lines[-1])
         self.editor_window.update_plots(update_data=False)
     
     def print_parameters(self,line):
@@ -973,9 +1031,10 @@ class Sidebar1D(QtWidgets.QWidget):
                         else:
                             error = np.abs(x) * float(self.parent.plotted_lines[line][axiserr].replace('%','')) / 100
                     else:
-                    # Get the error data from the loaded data
+                    # Get the error data from the loaded data. No copy needed: the filters below
+                    # and plot_Xerr/plot_Yerr only ever build new arrays from it.
                         errorname = self.parent.plotted_lines[line][axiserr]
-                        error = copy.deepcopy(self.parent.data_dict[errorname])
+                        error = self.parent.data_dict[errorname]
                 # Only apply multiply or divide filters (and only if they are checked of course)
                 if 'filters' in self.parent.plotted_lines[line].keys():
                     for filt in self.parent.plotted_lines[line]['filters']:
@@ -991,11 +1050,23 @@ class Sidebar1D(QtWidgets.QWidget):
                 else:
                     self.plot_Xerr(x,y,error,line)
 
-    def draw_plot(self,clearplot=True):
+    def draw_plot(self,clearplot=True,lines=None):
         if clearplot:
             self.parent.axes.clear()
-        lines = self.get_checked_items()
+        if lines is None:
+            lines = self.get_checked_items()
         if len(lines) > 0:
+            # The plot type is the same for every line, so set labels and drawstyle once.
+            if self.parent.plot_type == 'Histogram':
+                self.parent.settings['ylabel'] = 'Counts'
+                if 'default_ylabel' in self.parent.settings.keys():
+                    self.parent.settings['xlabel'] = self.parent.settings['default_ylabel']
+                drawstyle='steps-mid'
+            else:
+                drawstyle='default'
+            if 'FFT' in self.editor_window.plot_type_box.currentText():
+                self.parent.settings['ylabel'] = 'Amplitude (a.u.)'
+                self.parent.settings['xlabel'] = 'Frequency'
             for line in lines:
                 x,y= self.get_line_data(line)
                 if len(x)!=len(y):
@@ -1005,16 +1076,6 @@ class Sidebar1D(QtWidgets.QWidget):
                         # Instead of crashing the program and throwing an error, 
                         # just skip plotting until they choose something sensible.
                 else:
-                    if self.parent.plot_type == 'Histogram':
-                        self.parent.settings['ylabel'] = 'Counts'
-                        if 'default_ylabel' in self.parent.settings.keys():
-                            self.parent.settings['xlabel'] = self.parent.settings['default_ylabel']
-                        drawstyle='steps-mid'
-                    else:
-                        drawstyle='default'
-                    if 'FFT' in self.editor_window.plot_type_box.currentText():
-                        self.parent.settings['ylabel'] = 'Amplitude (a.u.)'
-                        self.parent.settings['xlabel'] = 'Frequency'
                     #self.parent.image = 
                     self.parent.axes.plot(x, y,
                                         self.parent.plotted_lines[line]['linestyle'],
@@ -1031,13 +1092,13 @@ class Sidebar1D(QtWidgets.QWidget):
             self.parent.apply_axscale_settings()
             if self.parent.legend:
                 self.parent.axes.legend()
-        self.editor_window.figure.tight_layout()
+        # No tight_layout here: the editor's update_plots sets the subplot layout after all plots are drawn.
 
     def draw_fits(self,line):
         try:
             fit_result=self.parent.plotted_lines[line]['fit']['fit_result']
             x_forfit=self.parent.plotted_lines[line]['fit']['xdata']
-            y_fit=fit_result.best_fit
+            y_fit=self.parent.plotted_lines[line]['fit']['fitted_y']
             self.parent.axes.plot(x_forfit, y_fit, 'k--',
                 linewidth=self.parent.plotted_lines[line]['linewidth'])
             if self.parent.plotted_lines[line]['fit']['fit_uncertainty_checkstate'] == QtCore.Qt.Checked:
@@ -1046,11 +1107,8 @@ class Sidebar1D(QtWidgets.QWidget):
                     alpha=0.2, color='grey', linewidth=0)
             if self.parent.plotted_lines[line]['fit']['fit_components_checkstate'] == QtCore.Qt.Checked:
                 fit_components=fit_result.eval_components()
-                if self.colormap_box.currentText() == 'viridis':
-                    selected_colormap = cm.get_cmap('plasma')
-                elif self.colormap_box.currentText() == 'plasma':
-                    selected_colormap = cm.get_cmap('viridis')
-                line_colors = selected_colormap(np.linspace(0.1,0.9,len(fit_components.keys())))
+                selected_colormap = _COMPONENT_CMAPS.get(self.colormap_box.currentText(), _PLASMA)
+                line_colors = selected_colormap(_component_color_positions(len(fit_components.keys())))
                 for i,key in enumerate(fit_components.keys()):
                     self.parent.axes.plot(x_forfit, fit_components[key], '--', color=line_colors[i],alpha=0.75, linewidth=self.parent.plotted_lines[line]['linewidth'])
         except Exception as e:
@@ -1077,13 +1135,9 @@ class Sidebar1D(QtWidgets.QWidget):
                          'X_param':self.parent.plotted_lines[line]['X data'],
                          'Y_param':self.parent.plotted_lines[line]['Y data']}
             for key in self.parent.plotted_lines[line]['stats'].keys():
-                if isinstance(self.parent.plotted_lines[line]['stats'][key],np.ndarray):
-                    export_dict[key] = self.parent.plotted_lines[line]['stats'][key].tolist()
-                else:
-                    export_dict[key] = self.parent.plotted_lines[line]['stats'][key]
+                export_dict[key] = _stats_value_for_json(self.parent.plotted_lines[line]['stats'][key])
             try:
-                with open(filename, 'w', encoding='utf-8') as f:
-                    jsondump(export_dict, f, ensure_ascii=False,indent=4)
+                _write_stats_json(export_dict,filename)
             except Exception as e:
                 self.editor_window.log_error(f'Could not save statistics:\n{type(e).__name__}: {e}', show_popup=True)
 
@@ -1116,13 +1170,9 @@ class Sidebar1D(QtWidgets.QWidget):
                 export_dict['linetrace_stats'][line]['X_param']=self.parent.plotted_lines[line]['X data']
                 export_dict['linetrace_stats'][line]['Y_param']=self.parent.plotted_lines[line]['Y data']
                 for key in self.parent.plotted_lines[line]['stats'].keys():
-                    if isinstance(self.parent.plotted_lines[line]['stats'][key],np.ndarray):
-                        export_dict['linetrace_stats'][line][key] = self.parent.plotted_lines[line]['stats'][key].tolist()
-                    else:
-                        export_dict['linetrace_stats'][line][key] = self.parent.plotted_lines[line]['stats'][key]
+                    export_dict['linetrace_stats'][line][key] = _stats_value_for_json(self.parent.plotted_lines[line]['stats'][key])
             try:
-                with open(filename, 'w', encoding='utf-8') as f:
-                    jsondump(export_dict, f, ensure_ascii=False,indent=4)
+                _write_stats_json(export_dict,filename)
             except Exception as e:
                 self.editor_window.log_error(f'Could not save statistics:\n{type(e).__name__}: {e}', show_popup=True)
         else:
@@ -1138,9 +1188,7 @@ class Sidebar1D(QtWidgets.QWidget):
             line = int(self.trace_table.item(row,0).text())
         else:
             manual=False
-            for row in range(self.trace_table.rowCount()):
-                if int(self.trace_table.item(row,0).text())==line:
-                    break        
+            row = self._row_of_line[line]
 
         if 'fit' in self.parent.plotted_lines[line].keys():
             self.parent.plotted_lines[line].pop('fit')
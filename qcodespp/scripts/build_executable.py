@@ -2,15 +2,129 @@
 """
 Build script for creating Windows executable of QCodes++ offline plotting GUI.
 Requires PyInstaller: pip install pyinstaller
+
+Builds are incremental: PyInstaller's work directory (build/<name>) and bincache
+(.pyinstaller-cache) are kept between runs, so rebuilds skip most of the analysis.
+To force a cold build, delete the build/, .pyinstaller-cache/ and .build-cache/ directories.
+Executables are built as a directory (dist/<name>/<name>.exe) so that launching doesn't first
+extract the whole bundle to a temporary directory. Set QCODESPP_ONEFILE=1 to build single-file
+executables (dist/<name>.exe) instead.
+If neither the bundled qcodespp package, the launcher, the build command, the Python version
+nor any installed package version has changed since the last successful build (tracked by
+content hash in .build-cache/), the build is skipped entirely. Delete .build-cache/ to force a rebuild.
 """
 
+import hashlib
+import importlib.metadata
 import os
 import sys
 import subprocess
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 
-def build_executable():
+def _pyinstaller_env(cache_name=None):
+    """Environment for PyInstaller with a per-project bincache that survives between runs.
+    
+    Builds running at the same time must not share a bincache, so give each a cache_name."""
+    cache_dir = Path(".pyinstaller-cache")
+    if cache_name:
+        cache_dir = cache_dir / cache_name
+    env = os.environ.copy()
+    env["PYINSTALLER_CONFIG_DIR"] = str(cache_dir.resolve())
+    return env
+
+
+def _onefile():
+    """True if single-file executables were requested via QCODESPP_ONEFILE."""
+    return bool(os.environ.get("QCODESPP_ONEFILE"))
+
+
+def _exe_path(name, folder=None):
+    """Location of the built executable: dist/<name>.exe for onefile builds, else dist/<folder>/<name>.exe."""
+    if _onefile():
+        return f"dist/{name}.exe"
+    return f"dist/{folder or name}/{name}.exe"
+
+
+def _hash_package(root):
+    """SHA256 over the relative paths and contents of all files below root, in sorted order."""
+    digest = hashlib.sha256()
+    root = Path(root)
+    if root.exists():
+        for path in sorted(root.rglob("*")):
+            if path.is_file() and "__pycache__" not in path.parts:
+                digest.update(str(path.relative_to(root)).encode())
+                digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def _environment_versions():
+    """Sorted name==version of every installed distribution, i.e. PyInstaller/Nuitka and everything they can bundle."""
+    versions = {f"{dist.metadata['Name']}=={dist.version}" for dist in importlib.metadata.distributions()}
+    return "\n".join(sorted(versions))
+
+
+def _build_digest(cmd):
+    """Digest of everything that ends up in the executable: the qcodespp payload, the launcher, the command,
+    the interpreter and the installed packages."""
+    digest = hashlib.sha256()
+    digest.update(_hash_package("qcodespp").encode())
+    digest.update(sys.version.encode())
+    digest.update(_environment_versions().encode())
+    digest.update((Path(__file__).parent / "qcodespp_gui_launcher.py").read_bytes())
+    digest.update(" ".join(cmd).encode())
+    return digest.hexdigest()
+
+
+def _build_is_current(name, cmd, outputs):
+    """True if the outputs exist and were built from identical inputs."""
+    digest_file = Path(".build-cache") / f"{name}.sha256"
+    if not digest_file.exists() or not all(Path(output).exists() for output in outputs):
+        return False
+    return digest_file.read_text().strip() == _build_digest(cmd)
+
+
+def _record_build(name, cmd):
+    """Store the digest of a successful build."""
+    cache_dir = Path(".build-cache")
+    cache_dir.mkdir(exist_ok=True)
+    (cache_dir / f"{name}.sha256").write_text(_build_digest(cmd))
+
+
+def _run_pyinstaller(cmd, name, cache_name=None, quiet=False):
+    """Run PyInstaller, raising CalledProcessError if it fails.
+    
+    By default the output streams straight to the console, so progress is visible and nothing is
+    buffered in memory. Concurrent builds (those with a cache_name) write to build/pyinstaller-<name>.log
+    instead, so their output doesn't interleave. With quiet=True the output is captured and only
+    attached to the exception, e.g. for CI."""
+    env = _pyinstaller_env(cache_name)
+    if quiet:
+        subprocess.run(cmd, env=env, check=True, capture_output=True, text=True)
+        return
+    if cache_name:
+        log_path = Path("build") / f"pyinstaller-{name}.log"
+        log_path.parent.mkdir(exist_ok=True)
+        print(f"PyInstaller output for {name} is written to {log_path}")
+        with open(log_path, "w") as log:
+            returncode = subprocess.Popen(cmd, env=env, stdout=log, stderr=subprocess.STDOUT).wait()
+    else:
+        returncode = subprocess.Popen(cmd, env=env).wait()
+    if returncode != 0:
+        raise subprocess.CalledProcessError(returncode, cmd)
+
+
+def _print_build_failure(e):
+    print(f"Build failed: {e}")
+    # Output is only captured in quiet mode; otherwise it has already been shown or logged.
+    if e.stdout:
+        print("STDOUT:", e.stdout)
+    if e.stderr:
+        print("STDERR:", e.stderr)
+
+
+def build_executable(cache_name=None, quiet=False):
     """Build Windows executable using PyInstaller."""
     
     # Check if PyInstaller is available
@@ -30,30 +144,37 @@ def build_executable():
     # PyInstaller command
     cmd = [
         "pyinstaller",
-        "--onefile",                    # Create single executable
+        "--onefile" if _onefile() else "--onedir",  # Single executable, or executable plus directory
         "--windowed",                   # No console window (GUI only)
+        "--noconfirm",                  # Reuse previous build output without asking
+        "--workpath", str(Path("build") / "QCodesPP-OfflinePlotting"),
+        "--distpath", "dist",
         "--name=QCodesPP-OfflinePlotting",  # Executable name
         "--icon=NONE",                  # Could add icon here
         "--add-data=qcodespp;qcodespp", # Include qcodespp package
         str(script_path)
     ]
     
+    exe_path = _exe_path("QCodesPP-OfflinePlotting")
+    if _build_is_current("QCodesPP-OfflinePlotting", cmd, [exe_path]):
+        print("Windows executable is up to date, skipping build.")
+        return True
+    
     print("Building Windows executable...")
     print("Command:", " ".join(cmd))
     
     try:
-        result = subprocess.run(cmd, check=True, capture_output=True, text=True)
+        _run_pyinstaller(cmd, "QCodesPP-OfflinePlotting", cache_name, quiet)
+        _record_build("QCodesPP-OfflinePlotting", cmd)
         print("Build successful!")
-        print("Executable location: dist/QCodesPP-OfflinePlotting.exe")
+        print(f"Executable location: {exe_path}")
         return True
     except subprocess.CalledProcessError as e:
-        print(f"Build failed: {e}")
-        print("STDOUT:", e.stdout)
-        print("STDERR:", e.stderr)
+        _print_build_failure(e)
         return False
 
 
-def build_console_executable():
+def build_console_executable(cache_name=None, quiet=False):
     """Build Windows console executable using PyInstaller."""
     
     # Check if PyInstaller is available
@@ -73,50 +194,261 @@ def build_console_executable():
     # PyInstaller command for console version
     cmd = [
         "pyinstaller",
-        "--onefile",                    # Create single executable
+        "--onefile" if _onefile() else "--onedir",  # Single executable, or executable plus directory
         "--console",                    # Keep console window for debugging
+        "--noconfirm",                  # Reuse previous build output without asking
+        "--workpath", str(Path("build") / "QCodesPP-OfflinePlotting-Console"),
+        "--distpath", "dist",
         "--name=QCodesPP-OfflinePlotting-Console",  # Executable name
         "--icon=NONE",                  # Could add icon here
         "--add-data=qcodespp;qcodespp", # Include qcodespp package
         str(script_path)
     ]
     
+    exe_path = _exe_path("QCodesPP-OfflinePlotting-Console")
+    if _build_is_current("QCodesPP-OfflinePlotting-Console", cmd, [exe_path]):
+        print("Windows console executable is up to date, skipping build.")
+        return True
+    
     print("Building Windows console executable...")
     print("Command:", " ".join(cmd))
     
     try:
-        result = subprocess.run(cmd, check=True, capture_output=True, text=True)
+        _run_pyinstaller(cmd, "QCodesPP-OfflinePlotting-Console", cache_name, quiet)
+        _record_build("QCodesPP-OfflinePlotting-Console", cmd)
         print("Build successful!")
-        print("Executable location: dist/QCodesPP-OfflinePlotting-Console.exe")
+        print(f"Executable location: {exe_path}")
         return True
     except subprocess.CalledProcessError as e:
-        print(f"Build failed: {e}")
-        print("STDOUT:", e.stdout)
-        print("STDERR:", e.stderr)
+        _print_build_failure(e)
         return False
 
 
+SPEC_TEMPLATE = """# -*- mode: python ; coding: utf-8 -*-
+# Generated by build_executable.py. GUI and console executables share one Analysis,
+# so the module graph is only built once.
+
+a = Analysis(
+    [{script_path!r}],
+    datas=[('qcodespp', 'qcodespp')],
+)
+pyz = PYZ(a.pure)
+
+gui_exe = EXE(
+    pyz,
+    a.scripts,
+    a.binaries,
+    a.datas,
+    [],
+    name='QCodesPP-OfflinePlotting',
+    console=False,
+)
+
+console_exe = EXE(
+    pyz,
+    a.scripts,
+    a.binaries,
+    a.datas,
+    [],
+    name='QCodesPP-OfflinePlotting-Console',
+    console=True,
+)
+"""
+
+# Onedir variant: both executables share one directory holding the binaries and data.
+SPEC_TEMPLATE_ONEDIR = """# -*- mode: python ; coding: utf-8 -*-
+# Generated by build_executable.py. GUI and console executables share one Analysis,
+# so the module graph is only built once, and one directory of binaries and data.
+
+a = Analysis(
+    [{script_path!r}],
+    datas=[('qcodespp', 'qcodespp')],
+)
+pyz = PYZ(a.pure)
+
+gui_exe = EXE(
+    pyz,
+    a.scripts,
+    [],
+    exclude_binaries=True,
+    name='QCodesPP-OfflinePlotting',
+    console=False,
+)
+
+console_exe = EXE(
+    pyz,
+    a.scripts,
+    [],
+    exclude_binaries=True,
+    name='QCodesPP-OfflinePlotting-Console',
+    console=True,
+)
+
+coll = COLLECT(
+    gui_exe,
+    console_exe,
+    a.binaries,
+    a.datas,
+    name='QCodesPP-OfflinePlotting',
+)
+"""
+
+
+def build_spec():
+    """Write a PyInstaller spec file that builds the GUI and console executables together."""
+    script_path = Path(__file__).parent / "qcodespp_gui_launcher.py"
+    if _onefile():
+        spec_path, template = Path("QCodesPP-OfflinePlotting.spec"), SPEC_TEMPLATE
+    else:
+        spec_path, template = Path("QCodesPP-OfflinePlotting-onedir.spec"), SPEC_TEMPLATE_ONEDIR
+    spec_path.write_text(template.format(script_path=str(script_path.resolve())))
+    return spec_path
+
+
+def build_both_executables(quiet=False):
+    """Build the GUI and console executables from a single shared PyInstaller analysis."""
+    
+    # Check if PyInstaller is available
+    try:
+        import PyInstaller
+    except ImportError:
+        print("PyInstaller not found. Install with: pip install pyinstaller")
+        return False
+    
+    script_path = Path(__file__).parent / "qcodespp_gui_launcher.py"
+    
+    if not script_path.exists():
+        print(f"Error: {script_path} not found")
+        return False
+    
+    spec_path = build_spec()
+    cmd = [
+        "pyinstaller",
+        "--noconfirm",
+        "--workpath", str(Path("build") / "QCodesPP-OfflinePlotting-both"),
+        "--distpath", "dist",
+        str(spec_path)
+    ]
+    
+    exe_paths = [_exe_path("QCodesPP-OfflinePlotting"),
+                 _exe_path("QCodesPP-OfflinePlotting-Console", folder="QCodesPP-OfflinePlotting")]
+    if _build_is_current("QCodesPP-OfflinePlotting-both", cmd, exe_paths):
+        print("Windows executables are up to date, skipping build.")
+        return True
+    
+    print("Building Windows GUI and console executables...")
+    print("Command:", " ".join(cmd))
+    
+    try:
+        _run_pyinstaller(cmd, "QCodesPP-OfflinePlotting-both", quiet=quiet)
+        _record_build("QCodesPP-OfflinePlotting-both", cmd)
+        print("Build successful!")
+        print("Executable locations: " + ", ".join(exe_paths))
+        return True
+    except subprocess.CalledProcessError as e:
+        _print_build_failure(e)
+        return False
+
+
+def build_nuitka(quiet=False):
+    """Build a standalone GUI executable by compiling the launcher with Nuitka instead of PyInstaller."""
+    
+    # Check if Nuitka is available
+    try:
+        import nuitka
+    except ImportError:
+        print("Nuitka not found. Install with: pip install nuitka")
+        return False
+    
+    script_path = Path(__file__).parent / "qcodespp_gui_launcher.py"
+    
+    if not script_path.exists():
+        print(f"Error: {script_path} not found")
+        return False
+    
+    cmd = [
+        sys.executable, "-m", "nuitka",
+        "--standalone",
+        "--windows-disable-console",    # No console window (GUI only)
+        "--enable-plugin=pyqt5",
+        "--output-dir=dist-nuitka",
+        "--include-package=qcodespp",
+        str(script_path)
+    ]
+    
+    exe_path = "dist-nuitka/qcodespp_gui_launcher.dist/qcodespp_gui_launcher.exe"
+    if _build_is_current("QCodesPP-OfflinePlotting-nuitka", cmd, [exe_path]):
+        print("Nuitka executable is up to date, skipping build.")
+        return True
+    
+    # Nuitka keeps its compilation caches here, so rebuilds only recompile changed modules.
+    env = os.environ.copy()
+    env["NUITKA_CACHE_DIR"] = str((Path(".build-cache") / "nuitka-ast").resolve())
+    
+    print("Building Windows executable with Nuitka...")
+    print("Command:", " ".join(cmd))
+    
+    try:
+        subprocess.run(cmd, env=env, check=True, capture_output=quiet, text=True)
+        _record_build("QCodesPP-OfflinePlotting-nuitka", cmd)
+        print("Build successful!")
+        print(f"Executable location: {exe_path}")
+        return True
+    except subprocess.CalledProcessError as e:
+        _print_build_failure(e)
+        return False
+
+
+def _run(kind, quiet=False):
+    """Build one executable kind ('gui' or 'console') in a worker process, with its own bincache."""
+    if kind == "gui":
+        return build_executable(cache_name="gui", quiet=quiet)
+    return build_console_executable(cache_name="console", quiet=quiet)
+
+
+def build_both_executables_parallel(quiet=False):
+    """Build the GUI and console executables as two concurrent PyInstaller runs.
+    
+    Unlike build_both_executables, each executable gets its own directory (dist/QCodesPP-OfflinePlotting/ and
+    dist/QCodesPP-OfflinePlotting-Console/), since two separate runs can't collect into one directory."""
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        return all(executor.map(_run, ["gui", "console"], [quiet, quiet]))
+
+
 def main():
     """Main build function."""
     if len(sys.argv) > 1:
+        quiet = "--quiet" in sys.argv[2:]
         if sys.argv[1] == "--console":
-            build_console_executable()
+            build_console_executable(quiet=quiet)
         elif sys.argv[1] == "--gui":
-            build_executable()
+            build_executable(quiet=quiet)
         elif sys.argv[1] == "--both":
-            build_console_executable()
-            build_executable()
+            if "--parallel" in sys.argv[2:]:
+                build_both_executables_parallel(quiet=quiet)
+            else:
+                build_both_executables(quiet=quiet)
+        elif sys.argv[1] == "--nuitka":
+            build_nuitka(quiet=quiet)
         else:
-            print("Usage: python build_executable.py [--console|--gui|--both]")
+            print("Usage: python build_executable.py [--console|--gui|--both [--parallel]|--nuitka] [--quiet]")
     else:
         print("QCodes++ Executable Builder")
         print("Usage:")
         print("  python build_executable.py --console    # Build console version")
         print("  python build_executable.py --gui        # Build GUI version")
         print("  python build_executable.py --both       # Build both versions")
+        print("  python build_executable.py --both --parallel  # Build both versions as two concurrent builds;")
+        print("                                                # the console version goes to its own")
+        print("                                                # dist/QCodesPP-OfflinePlotting-Console/ directory")
+        print("  python build_executable.py --nuitka     # Build GUI version compiled with Nuitka")
+        print("")
+        print("Add --quiet to hide PyInstaller output unless the build fails (e.g. for CI).")
+        print("Set QCODESPP_ONEFILE=1 to build single-file executables instead of executable directories.")
         print("")
         print("Requirements:")
         print("  pip install pyinstaller")
+        print("  pip install nuitka                      # only for --nuitka")
 
 
 if __name__ == "__main__":
@@ -7,13 +7,14 @@ Standalone executable version for Windows distribution.
 import sys
 import os
 import traceback
-import tkinter as tk
-from tkinter import messagebox
 
 
 def show_error(title, message):
     """Show error dialog with fallback to console."""
     try:
+        # Imported here, as it's only needed for errors and would otherwise slow down every launch.
+        import tkinter as tk
+        from tkinter import messagebox
         root = tk.Tk()
         root.withdraw()  # Hide the root window
         messagebox.showerror(title, message)
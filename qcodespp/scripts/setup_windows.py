@@ -6,6 +6,13 @@ Creates desktop and start menu shortcuts for qcodes++ offline plotting tool and
 import os
 import sys
 from pathlib import Path
+try:
+    import winshell # pip install pywin32 winshell
+    import pythoncom
+    from win32com.shell import shell as shellcom
+    windows_shell_imported = True
+except ImportError:
+    windows_shell_imported = False
 
 
 def is_windows():
@@ -31,7 +38,6 @@ def create_shortcut_script():
 qcodes++ Offline Plotting Launcher
 """
 import sys
-import subprocess
 
 def main():
     """Launch qcodes++ offline plotting."""
@@ -40,9 +46,11 @@ def main():
         from qcodespp.plotting.offline.main import offline_plotting
         offline_plotting()
     except ImportError:
-        # Fall back to command line
+        # Fall back to the command line entry point, run in this interpreter rather than a new one
         try:
-            subprocess.run([sys.executable, "-m", "qcodespp.cli", "offline_plotting"])
+            import runpy
+            sys.argv = ["qcodespp.cli", "offline_plotting"]
+            runpy.run_module("qcodespp.cli", run_name="__main__", alter_sys=True)
         except Exception as e:
             print(f"Failed to launch qcodes++ offline plotting: {e}")
             input("Press Enter to exit...")
@@ -58,22 +66,40 @@ if __name__ == "__main__":
     
     launcher_path = scripts_dir / "qcodespp-offline-plotting-launcher.py"
     
-    with open(launcher_path, 'w') as f:
-        f.write(script_content)
+    # Leave an identical launcher untouched, so it isn't rewritten (and rescanned by antivirus) on every run.
+    new_content = script_content.encode()
+    if launcher_path.exists() and launcher_path.read_bytes() == new_content:
+        return launcher_path
+
+    # Write to a temporary file first so an interrupted write never leaves a partial launcher.
+    tmp_path = launcher_path.with_suffix('.tmp')
+    tmp_path.write_bytes(new_content)
+    os.replace(tmp_path, launcher_path)
     
     return launcher_path
 
 
+def _make_lnk(path, target, args, workdir, icon, desc):
+    """Write a .lnk shortcut through the IShellLinkW/IPersistFile COM interfaces.
+    
+    Binding the interfaces directly avoids the late-bound IDispatch calls of WScript.Shell."""
+    link = pythoncom.CoCreateInstance(shellcom.CLSID_ShellLink, None,
+                                      pythoncom.CLSCTX_INPROC_SERVER, shellcom.IID_IShellLink)
+    link.SetPath(target)
+    link.SetArguments(args)
+    link.SetWorkingDirectory(workdir)
+    link.SetIconLocation(icon, 0)
+    link.SetDescription(desc)
+    link.QueryInterface(pythoncom.IID_IPersistFile).Save(path, 0)
+
+
 def create_windows_shortcuts(path=None):
     """Create Windows shortcuts for qcodes++ offline plotting."""
     if not is_windows():
         print("This function is only for Windows systems.")
         return
     
-    try:
-        import winshell
-        from win32com.client import Dispatch
-    except ImportError:
+    if not windows_shell_imported:
         print("Windows shell libraries not available. Install with:")
         print("pip install pywin32 winshell")
         return
@@ -89,106 +115,43 @@ def create_windows_shortcuts(path=None):
     python_exe = find_python_executable()
     pythonw_exe = find_pythonw_executable()
     
-    # Desktop shortcut
+    # Look up the shell locations and icons once and reuse them for all shortcuts.
     desktop = winshell.desktop()
+    start_menu = winshell.start_menu()
+    qcodespp_folder = os.path.join(start_menu, "qcodes++")
+    offline_icon = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "plotting", "offline", "iconGadget.ico"))
+    jupyter_icon = os.path.abspath(os.path.join(os.path.dirname(__file__), "jupyter.ico"))
+    # Fall back to the python executable's icon if ours are missing
+    if not os.path.exists(offline_icon):
+        offline_icon = python_exe
+    if not os.path.exists(jupyter_icon):
+        jupyter_icon = python_exe
+
+    # (description for messages, folder, filename, target, arguments, icon, shortcut description)
+    shortcuts = [
+        ("offline plotting desktop shortcut", desktop, "qcodes++ Offline Plotting.lnk",
+         pythonw_exe, f'"{launcher_path}"', offline_icon, "qcodes++ Offline Plotting Tool"),
+        ("offline plotting start menu shortcut", qcodespp_folder, "qcodes++ Offline Plotting.lnk",
+         pythonw_exe, f'"{launcher_path}"', offline_icon, "qcodes++ Offline Plotting Tool"),
+        ("Jupyter Lab desktop shortcut", desktop, "Jupyter Lab (qcodes++) .lnk",
+         python_exe, "-m jupyter lab", jupyter_icon, "Jupyter Lab (qcodes++ environment)"),
+        ("Jupyter Lab start menu shortcut", qcodespp_folder, "Jupyter Lab (qcodes++).lnk",
+         python_exe, "-m jupyter lab", jupyter_icon, "Jupyter Lab (qcodes++ environment)"),
+    ]
+
+    errors=[]
+    for label, folder, filename, target, args, icon, desc in shortcuts:
+        try:
+            os.makedirs(folder, exist_ok=True)
+            _make_lnk(os.path.join(folder, filename), target, args, path, icon, desc)
+            print(f"✓ Created {label}")
+        except Exception as e:
+            errors.append((label, e))
 
-    success=True
-
-    try:
-        desktop_shortcut = os.path.join(desktop, "qcodes++ Offline Plotting.lnk")
-        
-        shell = Dispatch('WScript.Shell')
-        shortcut = shell.CreateShortCut(desktop_shortcut)
-        shortcut.Targetpath = pythonw_exe
-        shortcut.Arguments = f'"{launcher_path}"'
-        shortcut.WorkingDirectory = path
-        # Set icon to iconGadget.ico in qcodespp/plotting/offline
-        icon_path = os.path.join(os.path.dirname(__file__), "..", "plotting", "offline", "iconGadget.ico")
-        icon_path = os.path.abspath(icon_path)
-        if os.path.exists(icon_path):
-            shortcut.IconLocation = icon_path
-        else:
-            shortcut.IconLocation = python_exe
-        shortcut.Description = "qcodes++ Offline Plotting Tool"
-        shortcut.save()
-
-        print(f"✓ Created offline plotting desktop shortcut")
-    except Exception as e:
-        success=False
-        print(f"✗ Failed to create offline plotting desktop shortcut: {e}")
-
-    # Start menu shortcut
-    try:
-        start_menu = winshell.start_menu()
-        qcodespp_folder = os.path.join(start_menu, "qcodes++")
-        os.makedirs(qcodespp_folder, exist_ok=True)
-        
-        start_menu_shortcut = os.path.join(qcodespp_folder, "qcodes++ Offline Plotting.lnk")
-        
-        shortcut = shell.CreateShortCut(start_menu_shortcut)
-        shortcut.Targetpath = pythonw_exe
-        shortcut.Arguments = f'"{launcher_path}"'
-        shortcut.WorkingDirectory = path
-        # Set icon to iconGadget.ico in qcodespp/plotting/offline
-        icon_path = os.path.join(os.path.dirname(__file__), "..", "plotting", "offline", "iconGadget.ico")
-        icon_path = os.path.abspath(icon_path)
-        if os.path.exists(icon_path):
-            shortcut.IconLocation = icon_path
-        else:
-            shortcut.IconLocation = python_exe
-        shortcut.Description = "qcodes++ Offline Plotting Tool"
-        shortcut.save()
-        
-        print(f"✓ Created offline plotting start menu shortcut")
-    except Exception as e:
-        success=False
-        print(f"✗ Failed to create start menu shortcut: {e}")
-
-    # Jupyter Lab desktop shortcut
-    try:
-        jupyter_lab_shortcut = os.path.join(desktop, "Jupyter Lab (qcodes++) .lnk")
-        shortcut = shell.CreateShortCut(jupyter_lab_shortcut)
-        shortcut.Targetpath = python_exe
-        shortcut.Arguments = "-m jupyter lab"
-        shortcut.WorkingDirectory = path
-        shortcut.Description = "Jupyter Lab (qcodes++ environment)"
-        shortcut.IconLocation = python_exe
-        icon_path = os.path.join(os.path.dirname(__file__), "jupyter.ico")
-        icon_path = os.path.abspath(icon_path)
-        if os.path.exists(icon_path):
-            shortcut.IconLocation = icon_path
-        else:
-            shortcut.IconLocation = python_exe
-        shortcut.save()
-        print(f"✓ Created Jupyter lab desktop shortcut")
-    except Exception as e:
-        success=False
-        print(f"✗ Failed to create Jupyter lab desktop shortcut: {e}")
-
-    # Jupyter Lab start menu shortcut
-    try:
-        start_menu = winshell.start_menu()
-        qcodespp_folder = os.path.join(start_menu, "qcodes++")
-        os.makedirs(qcodespp_folder, exist_ok=True)
-
-        jupyter_lab_start_menu_shortcut = os.path.join(qcodespp_folder, "Jupyter Lab (qcodes++).lnk")
-        shortcut = shell.CreateShortCut(jupyter_lab_start_menu_shortcut)
-        shortcut.Targetpath = python_exe
-        shortcut.Arguments = "-m jupyter lab"
-        shortcut.WorkingDirectory = path
-        shortcut.Description = "Jupyter Lab (qcodes++ environment)"
-        icon_path = os.path.join(os.path.dirname(__file__), "jupyter.ico")
-        icon_path = os.path.abspath(icon_path)
-        if os.path.exists(icon_path):
-            shortcut.IconLocation = icon_path
-        else:
-            shortcut.IconLocation = python_exe
-        shortcut.save()
-        print(f"✓ Created Jupyter Lab start menu shortcut")
-    except Exception as e:
-        
-        print(f"✗ Failed to create Jupyter Lab start menu shortcut: {e}")
+    for label, e in errors:
+        print(f"✗ Failed to create {label}: {e}")
 
+    success = len(errors) == 0
     return success
 
 def main():
@@ -7,6 +7,7 @@ This script helps Windows users set up QCodes++ with desktop integration.
 import sys
 import subprocess
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 
@@ -17,22 +18,34 @@ def check_windows():
         sys.exit(1)
 
 
-def install_dependencies():
-    """Install required dependencies for Windows integration."""
-    print("\nInstalling Windows integration dependencies...")
+def start_install_dependencies():
+    """Start installing the Windows integration dependencies in the background.
     
-    try:
-        subprocess.run([
-            sys.executable, "-m", "pip", "install", 
-            "pywin32", "winshell"
-        ], check=True)
+    Returns the running process; pass it to finish_install_dependencies."""
+    print("\nInstalling Windows integration dependencies in the background...")
+    return subprocess.Popen([
+        sys.executable, "-m", "pip", "install", 
+        "pywin32", "winshell"
+    ], stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+
+
+def finish_install_dependencies(process):
+    """Wait for a background dependency install to finish and report the result."""
+    output, _ = process.communicate()
+    if process.returncode == 0:
         print("✓ Windows dependencies installed successfully")
         return True
-    except subprocess.CalledProcessError as e:
-        print(f"✗ Failed to install dependencies: {e}")
+    else:
+        print(output)
+        print(f"✗ Failed to install dependencies: pip exited with code {process.returncode}")
         return False
 
 
+def install_dependencies():
+    """Install required dependencies for Windows integration."""
+    return finish_install_dependencies(start_install_dependencies())
+
+
 def create_shortcuts(path=None):
     """Create desktop and start menu shortcuts."""
     try:
@@ -89,17 +102,18 @@ def copy_scripts_to_desktop():
         # Get the scripts directory
         scripts_dir = Path(__file__).parent
         
-        # Copy batch script
-        batch_script = scripts_dir / "qcodespp-offline-plotting.bat"
-        if batch_script.exists():
-            shutil.copy(batch_script, desktop / "QCodes++ Offline Plotting.bat")
-            print("✓ Batch script copied to desktop")
-        
-        # Copy PowerShell script
-        ps_script = scripts_dir / "qcodespp-offline-plotting.ps1"
-        if ps_script.exists():
-            shutil.copy(ps_script, desktop / "QCodes++ Offline Plotting.ps1")
-            print("✓ PowerShell script copied to desktop")
+        # (source, destination, message) for the batch and PowerShell scripts
+        copies = [(scripts_dir / "qcodespp-offline-plotting.bat", desktop / "QCodes++ Offline Plotting.bat",
+                   "✓ Batch script copied to desktop"),
+                  (scripts_dir / "qcodespp-offline-plotting.ps1", desktop / "QCodes++ Offline Plotting.ps1",
+                   "✓ PowerShell script copied to desktop")]
+        copies = [copy for copy in copies if copy[0].exists()]
+
+        # Copy both at once; map re-raises any exception from the copies here.
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            list(executor.map(lambda copy: shutil.copy(copy[0], copy[1]), copies))
+        for _, _, message in copies:
+            print(message)
         
         return True
     except Exception as e:
@@ -138,9 +152,11 @@ def main(path=None):
     
     success = True
     
+    install_process = None
     if choice in ["1", "2", "4"]:
         print("\n" + "=" * 40)
-        success &= install_dependencies()
+        # Let pip run while the user is answering the prompt below.
+        install_process = start_install_dependencies()
 
     if choice in ["1", "4"]:
         if not path:
@@ -154,6 +170,11 @@ def main(path=None):
                 sys.exit(0)
             if path == "":
                 path = None
+
+    if install_process is not None:
+        success &= finish_install_dependencies(install_process)
+
+    if choice in ["1", "4"]:
         print("\n" + "=" * 40)
         success &= create_shortcuts(path=path)
 
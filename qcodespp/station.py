@@ -11,6 +11,7 @@ without the need for a separate measurement context.
 from typing import List, Sequence, Any
 
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 from qcodes.metadatable import MetadatableWithName
 
@@ -21,11 +22,14 @@ from qcodes.parameters import ParameterBase , ElapsedTimeParameter
 from qcodes import Station as QStation
 from qcodes import Instrument
 from qcodespp.actions import _actions_snapshot
-from numpy import mean
+import numpy as np
 
 import logging
 log = logging.getLogger(__name__)
 
+# Resolved on first use, since importing qcodespp.loops here would be circular.
+_Loop = None
+
 
 class Station(QStation):
     """
@@ -55,6 +59,14 @@ class Station(QStation):
 
         inc_timer: Include a timer parameter in the station and the default measurement.
 
+        eager_load: Load the config files immediately (default). If False, only check that they exist, and
+            parse them when first needed, i.e. when accessing station.config or a load_<instrument> shortcut,
+            listing the station's attributes, or loading an instrument.
+
+        parallel_update: When updating the snapshot, query the instruments concurrently from several threads.
+            Only enable this if no two instruments share a connection (e.g. one serial/GPIB port) and none
+            wraps other instruments in the station, otherwise their responses can get mixed up.
+
     """
 
     def __init__(
@@ -66,6 +78,8 @@ class Station(QStation):
         default: bool = True,
         update_snapshot: bool = True,
         inc_timer: bool = True,
+        eager_load: bool = True,
+        parallel_update: bool = False,
         **kwargs: Any,
     ) -> None:
         
@@ -98,7 +112,17 @@ class Station(QStation):
         else:
             self.config_file = list(config_file)
 
-        self.load_config_files(*self.config_file)
+        self.parallel_update = parallel_update
+
+        self._config_loaded = False
+        self._config_loading = False
+        if eager_load:
+            self._load_config()
+        else:
+            # Report a mistyped path here rather than from whichever call first needs the config.
+            for filename in self.config_file:
+                if self._get_config_file_path(filename) is None:
+                    raise FileNotFoundError(filename)
 
         if inc_timer==True:
             timer=ElapsedTimeParameter(name='timer')
@@ -109,6 +133,40 @@ class Station(QStation):
         if add_variables is not None:
             self.auto_add(add_variables)
 
+    def _load_config(self):
+        """Load the config files if that hasn't happened yet. A failed load is retried on the next access."""
+        if self._config_loaded or self._config_loading:
+            return
+        self._config_loading = True
+        try:
+            self.load_config_files(*self.config_file)
+            self._config_loaded = True
+        finally:
+            self._config_loading = False
+
+    @property
+    def config(self):
+        """The station configuration loaded from the config files."""
+        if not self.__dict__.get('_config_loaded', True):
+            self._load_config()
+        return self.__dict__.get('_station_config')
+
+    @config.setter
+    def config(self, value):
+        self._station_config = value
+
+    def load_instrument(self, identifier: str, revive_instance: bool = False,
+                        update_snapshot: bool = True, **kwargs: Any) -> Instrument:
+        """As QCoDeS Station.load_instrument, loading the config files first if necessary."""
+        self._load_config()
+        return super().load_instrument(identifier, revive_instance=revive_instance,
+                                       update_snapshot=update_snapshot, **kwargs)
+
+    def load_all_instruments(self, only_names=None, only_types=None):
+        """As QCoDeS Station.load_all_instruments, loading the config files first if necessary."""
+        self._load_config()
+        return super().load_all_instruments(only_names=only_names, only_types=only_types)
+
     def add_components(self,components):
         for component in components:
             self.add_component(component)
@@ -127,25 +185,29 @@ class Station(QStation):
             update_snapshot: If True, update the snapshot of each component as it is added to the Station.
         """
         print('Automatically adding components to Station...')
+        # Components need not be hashable, so track what's already present by id.
+        present = {id(component) for component in self.components.values()}
         for variable in variables.values():
-            if add_instruments and isinstance(variable,Instrument) and variable not in self.components.values():
-                self.add_component(variable,update_snapshot=update_snapshot)
-            elif add_parameters and isinstance(variable,ParameterBase) and variable not in self.components.values():
+            if id(variable) in present:
+                continue
+            if ((add_instruments and isinstance(variable,Instrument)) or 
+                (add_parameters and isinstance(variable,ParameterBase))):
                 self.add_component(variable,update_snapshot=update_snapshot)
+                present.add(id(variable))
+
+        insts=[]
+        params=[]
+        for component in self.components.values():
+            if isinstance(component,Instrument):
+                insts.append(component.name)
+            elif isinstance(component,ParameterBase):
+                params.append(component.full_name)
 
         if add_instruments:
-            inststring='Instruments in station:'
-            for component in self.components.values():
-                if isinstance(component,Instrument):
-                    inststring+=f' {component.name},'
-            print(inststring[:-1])
-
-        if add_parameters and 'parameters' in self.snapshot_base():
-            paramstring='Parameters in station:'
-            for component in self.components.values():
-                if isinstance(component,ParameterBase):
-                    paramstring+=f' {component.full_name},'
-            print(paramstring[:-1])
+            print('Instruments in station: '+', '.join(insts))
+
+        if add_parameters:
+            print('Parameters in station: '+', '.join(params))
 
     def snapshot_base(self, update: bool=False,
                       params_to_skip_update: Sequence[str]=None) -> dict:
@@ -164,6 +226,8 @@ class Station(QStation):
         Returns:
             dict: base snapshot
         """
+        # Deliberately not memoized: even with update=False the latest values of parameters change
+        # without any component being added or removed, and Loops record this snapshot as metadata.
         snap = {
             'instruments': {},
             'parameters': {},
@@ -174,20 +238,35 @@ class Station(QStation):
 
         components_to_remove = []
 
+        # instruments can be closed during the lifetime of the
+        # station object, hence this 'if' allows to avoid
+        # snapshotting instruments that are already closed
+        instruments = []
+        parameters = []
+        others = []
+        is_valid = Instrument.is_valid
         for name, itm in self.components.items():
             if isinstance(itm, Instrument):
-                # instruments can be closed during the lifetime of the
-                # station object, hence this 'if' allows to avoid
-                # snapshotting instruments that are already closed
-                if Instrument.is_valid(itm):
-                    snap['instruments'][name] = itm.snapshot(update=update)
+                if is_valid(itm):
+                    instruments.append((name, itm))
                 else:
                     components_to_remove.append(name)
-            elif isinstance(itm, (Parameter
-                                  )):
-                snap['parameters'][name] = itm.snapshot(update=update)
+            elif isinstance(itm, Parameter):
+                parameters.append((name, itm))
             else:
-                snap['components'][name] = itm.snapshot(update=update)
+                others.append((name, itm))
+
+        if update and self.parallel_update and len(instruments) > 1:
+            # Updating queries every instrument, so overlap their I/O rather than waiting on each in turn.
+            with ThreadPoolExecutor(max_workers=min(16, len(instruments))) as executor:
+                snapshots = list(executor.map(lambda item: item[1].snapshot(update=update), instruments))
+        else:
+            snapshots = [itm.snapshot(update=update) for name, itm in instruments]
+        snap['instruments'] = {name: instrument_snap for (name, itm), instrument_snap in zip(instruments, snapshots)}
+
+        snap['parameters'] = {name: itm.snapshot(update=update) for name, itm in parameters}
+
+        snap['components'] = {name: itm.snapshot(update=update) for name, itm in others}
 
         for c in components_to_remove:
             self.remove_component(c)
@@ -209,14 +288,18 @@ class Station(QStation):
         # and so we don't accept `Loop` as an action here, where
         # it would cause infinite recursion.
         # We need to import Loop inside here to avoid circular import
-        from .loops import Loop
-        Loop.validate_actions(*actions)
+        global _Loop
+        if _Loop is None:
+            from .loops import Loop as _Loop
+        _Loop.validate_actions(*actions)
 
         if check_in_station:
-            vals=self.components.values()
+            # Components need not be hashable, so compare by id.
+            vals_ids={id(component) for component in self.components.values()}
             for action in actions:
                 # If the action is a gettable parameter and neither it nor any of its ancestors are in the Station, warn the user.
-                if hasattr(action,'get') and action not in vals and hasattr(action, 'instrument') and action.instrument is not None and not any([ancestor in vals for ancestor in action.instrument.ancestors]):
+                if (hasattr(action,'get') and id(action) not in vals_ids and getattr(action, 'instrument', None) is not None 
+                    and not any(id(ancestor) in vals_ids for ancestor in action.instrument.ancestors)):
                     log.warning(f'Could not find {action.full_name} nor a possible parent instrument in the specified Station. '
                             'It is recommended to add the Parameter and/or Instrument to the Station before measuring to avoid loss of metadata.')
 
@@ -239,16 +322,15 @@ class Station(QStation):
         Returns:
             Either the average communication time or the list of communication times for each measurement.
         """
-        commtimes=[]
+        commtimes=np.empty(measurement_num, dtype=np.int64)
         for i in range(measurement_num):
-            starttime=time.time()
+            starttime=time.perf_counter_ns()
             self.measurement(include_callables=include_callables)
-            endtime=time.time()
-            commtimes.append(endtime-starttime)
+            commtimes[i]=time.perf_counter_ns()-starttime
         if return_average:
-            return mean(commtimes)
+            return float(commtimes.mean())/1e9
         else:
-            return commtimes
+            return (commtimes/1e9).tolist()
 
     def measurement(self, *actions, include_callables=True):
         """
@@ -297,4 +379,25 @@ class Station(QStation):
         """Shortcut to components dict."""
         return self.components[key]
 
+    def __getattr__(self, key):
+        # The only attributes the config files define are the load_<instrument> shortcuts.
+        if (key.startswith('load_') and not self.__dict__.get('_config_loaded', True)
+                and not self.__dict__.get('_config_loading', False)):
+            try:
+                self._load_config()
+            except Exception as e:
+                raise AttributeError(f"'{type(self).__name__}' object has no attribute '{key}' "
+                                     f"(loading the config files failed: {e})") from e
+            return getattr(self, key)
+        return super().__getattr__(key)
+
+    def __dir__(self):
+        # Include the load_<instrument> shortcuts in tab completion.
+        if not self.__dict__.get('_config_loaded', True):
+            try:
+                self._load_config()
+            except Exception as e:
+                log.warning(f'Could not load the station config files: {e}')
+        return super().__dir__()
+
     delegate_attr_dicts = ['components']
@@ -1,4 +1,10 @@
 import pyvisa
+from concurrent.futures import ThreadPoolExecutor
+
+BAUDRATE_LIBRARY={'qdac':(921600,),
+                  'standard':(460800,230400,115200,57600,38400,19200,14400,4800,2400,1200,600,300),
+                  'all':(921600,256000,153600,128000,56000,28800,110,460800,230400,115200,57600,38400,19200,14400,4800,2400,1200,600,300)}
+_VALID_BAUDRATES=frozenset(BAUDRATE_LIBRARY['all'])
 
 def listVISAinstruments(baudrates='qdac'):
     """
@@ -18,54 +24,68 @@ def listVISAinstruments(baudrates='qdac'):
         baudrate used by the qdac. If you want to check other baudrates, include them explicitly as a list,
         or use predefined lists 'standard' or 'all', with baudrates defined according the National Instruments standards.
     """
-    baudrate_library={'qdac':[921600],
-                'standard':[460800,230400,115200,57600,38400,19200,14400,4800,2400,1200,600,300],
-                'all':[921600,256000,153600,128000,56000,28800,110,460800,230400,115200,57600,38400,19200,14400,4800,2400,1200,600,300]}
-
-    if type(baudrates) is int:
-        if baudrates not in baudrate_library['all']:
+    if isinstance(baudrates, bool):
+        raise TypeError('baudrates must be either an integer, list of integers, or one of \'qdac\', \'standard\' or \'all\'')
+    elif isinstance(baudrates, int):
+        if baudrates not in _VALID_BAUDRATES:
             print(f'{baudrates} is not usually a supported baudrate: Check for typo')
         baudrates=[baudrates]
-    elif type(baudrates) is str:
-        if baudrates in ['qdac','standard','all']:
-            baudrates=baudrate_library[baudrates]
+    elif isinstance(baudrates, str):
+        if baudrates in BAUDRATE_LIBRARY:
+            baudrates=BAUDRATE_LIBRARY[baudrates]
         else:
             raise ValueError('baudrates must be one of \'qdac\', \'standard\' or \'all\' if providing string')
-    elif type(baudrates) is list:
+    elif isinstance(baudrates, list):
         for baudrate in baudrates:
-            if baudrate not in baudrate_library['all']:
+            if baudrate not in _VALID_BAUDRATES:
                 print(f'{baudrate} is not usually a supported baudrate: Check for typo')
     else:
         raise TypeError('baudrates must be either an integer, list of integers, or one of \'qdac\', \'standard\' or \'all\'')
 
     resman=pyvisa.ResourceManager()
-    for resource in resman.list_resources():
-        res=False
-        connected=False
-        e1=''
-        e2=''
+    resources=resman.list_resources()
+    # Probing waits on instrument I/O and timeouts, so probe all resources at once.
+    with ThreadPoolExecutor(max_workers=min(32, len(resources)) or 1) as executor:
+        for message in executor.map(lambda resource: _probe(resource, baudrates, resman), resources):
+            print(message)
+
+def _probe(resource, baudrates, resman):
+    """
+    Query the identification string of one VISA resource, trying each of baudrates if the default fails.
+
+    Returns:
+        str: The message to print for this resource.
+    """
+    res=False
+    e1=''
+    e2=''
+    try:
         try:
             res=resman.open_resource(resource)
             idn=res.query('*IDN?')
-            print(f'Instrument IDN: {idn} VISA Address: {resource}\n')
+            return f'Instrument IDN: {idn} VISA Address: {resource}\n'
         except Exception as e1:
-            for baudrate in baudrates:
-                try:
+            try:
+                # Reuse the handle if opening worked and only the query failed; only the baud rate changes.
+                if not res:
                     res=resman.open_resource(resource)
-                    res.baud_rate=baudrate
-                    print(f'Instrument IDN: {res.query('*IDN?')} VISA Address: {resource}\n')
-                    connected=True
-                    break
-                except Exception as e:
-                    e2=e
-                    pass
-                finally:
-                    res.baud_rate=9600
-            if connected==False:
-                print(f'Instrument with address {resource} raised exceptions:\n {e1}\n{e2}\n'
-                    'Possible causes: the instrument does not accept the \'IDN?\' command (e.g. it does not use SCPI, '
-                    'it is a composite instrument), or it '
-                    'is already connected, possibly in another program or ipython kernel.\n'
-                    'Or, there is another problem with the instrument configuration, use the exceptions to guide you.')
+                for baudrate in baudrates:
+                    try:
+                        res.baud_rate=baudrate
+                        idn=res.query('*IDN?')
+                        return f'Instrument IDN: {idn} VISA Address: {resource}\n'
+                    except Exception as e:
+                        e2=e
+                        pass
+                    finally:
+                        res.baud_rate=9600
+            except Exception as e:
+                e2=e
+            return (f'Instrument with address {resource} raised exceptions:\n {e1}\n{e2}\n'
+                'Possible causes: the instrument does not accept the \'IDN?\' command (e.g. it does not use SCPI, '
+                'it is a composite instrument), or it '
+                'is already connected, possibly in another program or ipython kernel.\n'
+                'Or, there is another problem with the instrument configuration, use the exceptions to guide you.')
+    finally:
         if res:
-            res.close()
\ No newline at end of file
+            res.close()